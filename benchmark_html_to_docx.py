@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+HTML to DOCX Traversal Benchmark
+
+Compares the single-pass walker used by the converters with the multi-sweep
+find_all traversals they used before, on a large generated document, then times
+the full conversions.
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from bs4 import BeautifulSoup
+
+from html_docx_walker import HEADING_TAGS, content_root, walk_elements
+from html_to_docx_simple import convert_html_to_docx
+from complete_html_to_docx_example import html_to_docx_converter
+
+BLOCK_TAGS = list(HEADING_TAGS) + ['p', 'ul', 'ol', 'table']
+
+def make_large_html(sections=2000):
+    """Generate a call-log style document with nested divs, lists and tables"""
+    parts = ["<html><head><title>Call Log Export</title></head><body>"]
+    for i in range(sections):
+        parts.append(
+            f"<div class='incident'><h2>Incident {i}</h2>"
+            f"<p>Bridge opened at <strong>{i % 24:02d}:00 UTC</strong>.</p>"
+            f"<div><p>Mitigation <em>step</em> {i}</p><ul><li>Fail over</li><li>Verify probes</li></ul></div>"
+            f"<table><tr><th>Metric</th><th>Value</th></tr><tr><td>Latency</td><td>{i} ms</td></tr></table></div>"
+        )
+    parts.append("</body></html>")
+    return "".join(parts)
+
+def legacy_simple_traversal(soup):
+    """The sweeps html_to_docx_simple.convert_html_to_docx used to make (headings first)"""
+    body = soup.find('body') if soup.find('body') else soup
+    emitted = list(body.find_all(list(HEADING_TAGS)))
+    emitted += body.find_all('p')
+    for ul in body.find_all('ul'):
+        emitted += ul.find_all('li')
+    for ol in body.find_all('ol'):
+        emitted += ol.find_all('li')
+    emitted += body.find_all('table')
+    return emitted
+
+def legacy_complete_traversal(soup):
+    """The nested find_all of complete_html_to_docx_example (divs re-scan their children)"""
+    emitted = []
+
+    def process(element):
+        if element.name == 'div':
+            for child in element.find_all(BLOCK_TAGS, recursive=False):
+                process(child)
+        else:
+            emitted.append(element)
+
+    for element in (soup.find('body') or soup).find_all(BLOCK_TAGS + ['div']):
+        process(element)
+    return emitted
+
+def single_pass_traversal(soup):
+    """The shared walker with handlers that only record what they are given"""
+    emitted = []
+    record = lambda doc, element: emitted.append(element)
+    walk_elements(None, content_root(soup), {tag: record for tag in BLOCK_TAGS})
+    return emitted
+
+def best_time(function, *args, repeat=5):
+    """Best wall time of `repeat` runs, and the last result"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    """Run the benchmark"""
+
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    html_content = make_large_html(sections)
+    soup = BeautifulSoup(html_content, 'html.parser')
+    elements = len(soup.find_all(True))
+
+    print("📊 HTML to DOCX Traversal Benchmark")
+    print("=" * 50)
+    print(f"   {sections:,} incident sections, {elements:,} elements")
+
+    walker_time, walked = best_time(single_pass_traversal, soup)
+    expected = sections * 5  # h2, p, nested p, ul, table per section
+    assert len(walked) == expected
+    assert [e.name for e in walked[:5]] == ['h2', 'p', 'p', 'ul', 'table']
+
+    print(f"\n🔍 Traversal only")
+    print(f"   {'Approach':<28} {'Time':>9} {'Emitted':>9}  Notes")
+    for label, function in [
+        ("Previous simple sweeps", legacy_simple_traversal),
+        ("Previous nested find_all", legacy_complete_traversal),
+    ]:
+        seconds, emitted = best_time(function, soup)
+        duplicates = len(emitted) - len(set(map(id, emitted)))
+        notes = f"{duplicates:,} duplicates" if duplicates else "headings moved first"
+        print(f"   {label:<28} {seconds * 1000:>7.1f}ms {len(emitted):>9,}  {notes}, {seconds / walker_time:.1f}x slower")
+    print(f"   {'Single-pass walker':<28} {walker_time * 1000:>7.1f}ms {len(walked):>9,}  document order")
+
+    # python-docx dominates end-to-end time, so convert a tenth of the document
+    convert_sections = max(1, sections // 10)
+    html_content = make_large_html(convert_sections)
+    print(f"\n📝 Full conversion (parse + build + save), {convert_sections:,} sections")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, convert in [
+            ("html_to_docx_simple", convert_html_to_docx),
+            ("complete_html_to_docx_example", html_to_docx_converter),
+        ]:
+            output = os.path.join(temp_dir, f"{label}.docx")
+            seconds, _ = best_time(convert, html_content, output, repeat=1)
+            print(f"   {label:<30} {seconds:.2f}s  ({os.path.getsize(output):,} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,129 @@
 # HTML to DOCX Converter
 # This script converts HTML content to a Microsoft Word DOCX file
 
-import re
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
-from bs4 import BeautifulSoup
-import html
 import os
 from datetime import datetime
 
+# python-docx, BeautifulSoup and lxml are imported on first use, so importing this
+# module stays cheap for short-lived converter processes
+
+DOCUMENT_PART = 'word/document.xml'
+
+class StreamingDocumentWriter:
+    """
+    Output backend that writes word/document.xml into the DOCX zip as blocks are produced
+    
+    All other parts (styles, numbering, relationships, properties) are copied from the
+    python-docx document when the writer is opened, so styles must be set up before that.
+    Each flush() serializes the finished body blocks and detaches them from the document,
+    so the in-memory tree never holds more than the block being built.
+    """
+    
+    def __init__(self, document, output_path, compresslevel=6):
+        import io
+        import re
+        import zipfile
+        from lxml import etree
+        
+        self.document = document
+        self.output_path = output_path
+        self.blocks_written = 0
+        self._tostring = etree.tostring
+        self._body = document.element.body
+        self._sect_pr = self._body.sectPr
+        
+        # Snapshot the package with an empty body; blocks added so far are streamed first
+        pending = self._detach_blocks()
+        snapshot = io.BytesIO()
+        document.save(snapshot)
+        
+        document_xml = self._tostring(document.element, encoding='UTF-8', xml_declaration=True, standalone=True)
+        if self._sect_pr is not None:
+            split_at = document_xml.index(b'<w:sectPr')
+        else:
+            document_xml = document_xml.replace(b'<w:body/>', b'<w:body></w:body>')
+            split_at = document_xml.index(b'</w:body>')
+        self._prefix, self._suffix = document_xml[:split_at], document_xml[split_at:]
+        
+        # Blocks are serialized on their own, repeating every namespace declaration in scope;
+        # the ones already declared on <w:document> are dropped from each block
+        root_start = document_xml[document_xml.index(b'<w:document'):]
+        root_start = root_start[:root_start.index(b'>')]
+        self._root_declarations = re.findall(rb' xmlns:\w+="[^"]*"', root_start)
+        
+        self._zip = zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+        try:
+            with zipfile.ZipFile(snapshot) as template:
+                for info in template.infolist():
+                    if info.filename != DOCUMENT_PART:
+                        self._zip.writestr(info.filename, template.read(info))
+            self._stream = self._zip.open(DOCUMENT_PART, 'w')
+            self._stream.write(self._prefix)
+            for element in pending:
+                self._write(element)
+        except Exception:
+            self._zip.close()
+            raise
+    
+    def _detach_blocks(self):
+        blocks = [child for child in self._body.iterchildren() if child is not self._sect_pr]
+        for child in blocks:
+            self._body.remove(child)
+        return blocks
+    
+    def _write(self, element):
+        xml = self._tostring(element)
+        start_tag_end = xml.index(b'>')
+        start_tag = xml[:start_tag_end]
+        for declaration in self._root_declarations:
+            start_tag = start_tag.replace(declaration, b'')
+        self._stream.write(start_tag + xml[start_tag_end:])
+        self.blocks_written += 1
+    
+    def flush(self):
+        """Write the finished body blocks and release them"""
+        for element in self._detach_blocks():
+            self._write(element)
+    
+    def close(self):
+        """Write the remaining blocks and the section properties, and finish the file"""
+        self.flush()
+        self._stream.write(self._suffix)
+        self._stream.close()
+        self._zip.close()
+    
+    def abort(self):
+        """Close and delete a partially written file"""
+        try:
+            self._stream.close()
+            self._zip.close()
+        finally:
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+
 class HTMLToDOCXConverter:
     """
     A class to convert HTML content to DOCX format
+    
+    With streaming=True the document body is written to the output file while it is being
+    converted (see StreamingDocumentWriter), so memory no longer grows with document length;
+    compresslevel (0-9) sets the deflate level of the streamed file.
     """
     
-    def __init__(self):
+    def __init__(self, streaming=False, compresslevel=6):
+        from docx import Document
+        
         self.document = Document()
+        self.streaming = streaming
+        self.compresslevel = compresslevel
+        self.writer = None
         self.setup_styles()
     
     def setup_styles(self):
         """Setup custom styles for the document"""
+        from docx.enum.style import WD_STYLE_TYPE
+        from docx.shared import Pt
+        
         styles = self.document.styles
         
         # Create heading styles if they don't exist
@@ -47,10 +148,13 @@ class HTMLToDOCXConverter:
     
     def clean_html(self, html_content):
         """Clean and normalize HTML content"""
+        import html
+        
         # Decode HTML entities
         html_content = html.unescape(html_content)
         
         # Parse with BeautifulSoup
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html_content, 'html.parser')
         
         # Remove script and style elements
@@ -94,6 +198,9 @@ class HTMLToDOCXConverter:
                     # Handle text nodes
                     paragraph = self.document.add_paragraph()
                     paragraph.add_run(child.string.strip())
+        
+        if self.writer:
+            self.writer.flush()
     
     def process_inline_elements(self, element, paragraph):
         """Process inline elements within a paragraph"""
@@ -115,6 +222,7 @@ class HTMLToDOCXConverter:
                     run = paragraph.add_run(f"{link_text} ({url})")
                     run.font.color.rgb = None  # Blue color for links
                 elif child.name == 'code':
+                    from docx.shared import Pt
                     run = paragraph.add_run(child.get_text())
                     run.font.name = 'Courier New'
                     run.font.size = Pt(10)
@@ -169,16 +277,12 @@ class HTMLToDOCXConverter:
                         for run in paragraph.runs:
                             run.bold = True
     
-    def convert_html_to_docx(self, html_content, output_path=None):
+    def process_html(self, html_content):
         """
-        Convert HTML content to DOCX file
+        Add the content of one HTML document or fragment to the document
         
         Args:
             html_content (str): HTML content to convert
-            output_path (str): Path for output DOCX file
-            
-        Returns:
-            str: Path to the created DOCX file
         """
         
         # Clean the HTML
@@ -208,16 +312,61 @@ class HTMLToDOCXConverter:
             for element in soup.children:
                 if hasattr(element, 'name') and element.name:
                     self.add_paragraph_with_formatting(element)
+    
+    def convert_html_fragments_to_docx(self, fragments, output_path=None):
+        """
+        Convert a sequence of HTML fragments (e.g. one per call-log entry) into one DOCX file
+        
+        Each fragment is parsed and released before the next one, so combined with
+        streaming=True neither the HTML nor the DOCX tree is held in memory as a whole.
+        
+        Args:
+            fragments (iterable): HTML strings, converted in order
+            output_path (str): Path for output DOCX file
+            
+        Returns:
+            str: Path to the created DOCX file
+        """
         
         # Generate output path if not provided
         if not output_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = f"converted_document_{timestamp}.docx"
         
+        if self.streaming:
+            self.writer = StreamingDocumentWriter(self.document, output_path, self.compresslevel)
+        
+        try:
+            for html_content in fragments:
+                self.process_html(html_content)
+        except Exception:
+            if self.writer:
+                self.writer.abort()
+                self.writer = None
+            raise
+        
         # Save the document
-        self.document.save(output_path)
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+        else:
+            self.document.save(output_path)
         
         return output_path
+    
+    def convert_html_to_docx(self, html_content, output_path=None):
+        """
+        Convert HTML content to DOCX file
+        
+        Args:
+            html_content (str): HTML content to convert
+            output_path (str): Path for output DOCX file
+            
+        Returns:
+            str: Path to the created DOCX file
+        """
+        
+        return self.convert_html_fragments_to_docx([html_content], output_path)
 
 def convert_html_file_to_docx(html_file_path, output_path=None):
     """
@@ -240,19 +389,21 @@ def convert_html_file_to_docx(html_file_path, output_path=None):
     converter = HTMLToDOCXConverter()
     return converter.convert_html_to_docx(html_content, output_path)
 
-def convert_html_string_to_docx(html_string, output_path=None):
+def convert_html_string_to_docx(html_string, output_path=None, streaming=False, compresslevel=6):
     """
     Convert an HTML string to DOCX
     
     Args:
         html_string (str): HTML content as string
         output_path (str): Path for output DOCX file
+        streaming (bool): Stream the document body to the file while converting
+        compresslevel (int): Deflate level (0-9) used when streaming
         
     Returns:
         str: Path to the created DOCX file
     """
     
-    converter = HTMLToDOCXConverter()
+    converter = HTMLToDOCXConverter(streaming=streaming, compresslevel=compresslevel)
     return converter.convert_html_to_docx(html_string, output_path)
 
 # Example usage and testing
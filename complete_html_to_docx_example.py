@@ -10,18 +10,12 @@ import os
 import sys
 from datetime import datetime
 
-# Import required libraries
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from bs4 import BeautifulSoup
-    import html
-    print("✅ All required packages imported successfully!")
-except ImportError as e:
-    print(f"❌ Missing package: {e}")
-    print("Please install: pip install python-docx beautifulsoup4 lxml")
-    sys.exit(1)
+# python-docx and BeautifulSoup are imported on first conversion, keeping imports cheap
+from html_docx_walker import (HEADING_TAGS, content_root, iter_list_items, list_item_contents,
+                              list_item_style, load_docx_dependencies, walk_elements)
+
+# Font size for <code> runs: 10 pt in EMU, i.e. docx.shared.Pt(10) without importing python-docx here
+CODE_FONT_SIZE = 10 * 12700
 
 def html_to_docx_converter(html_content, output_filename=None):
     """
@@ -37,6 +31,8 @@ def html_to_docx_converter(html_content, output_filename=None):
     
     print("🔄 Converting HTML to DOCX...")
     
+    Document, BeautifulSoup = load_docx_dependencies()
+    
     # Create a new document
     doc = Document()
     
@@ -52,11 +48,8 @@ def html_to_docx_converter(html_content, output_filename=None):
     if title and title.get_text().strip():
         doc.add_heading(title.get_text().strip(), 0)
     
-    # Process body content
-    body = soup.find('body') or soup
-    
-    for element in body.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'table', 'div']):
-        process_element(doc, element)
+    # Process body content in one document-order pass (divs are walked, not re-scanned)
+    walk_elements(doc, content_root(soup), ELEMENT_HANDLERS)
     
     # Generate filename if not provided
     if not output_filename:
@@ -67,40 +60,24 @@ def html_to_docx_converter(html_content, output_filename=None):
     doc.save(output_filename)
     return output_filename
 
-def process_element(doc, element):
-    """Process individual HTML elements"""
+def process_heading(doc, element):
+    """Process HTML headings"""
     
-    tag_name = element.name.lower()
+    level = int(element.name[1])
+    heading = doc.add_heading(level=level)
+    add_formatted_text(heading, element)
+
+def process_paragraph(doc, element):
+    """Process HTML paragraphs"""
     
-    if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-        # Handle headings
-        level = int(tag_name[1])
-        heading = doc.add_heading(level=level)
-        add_formatted_text(heading, element)
-        
-    elif tag_name == 'p':
-        # Handle paragraphs
-        if element.get_text().strip():  # Only add non-empty paragraphs
-            paragraph = doc.add_paragraph()
-            add_formatted_text(paragraph, element)
-            
-    elif tag_name in ['ul', 'ol']:
-        # Handle lists
-        process_list(doc, element)
-        
-    elif tag_name == 'table':
-        # Handle tables
-        process_table(doc, element)
-        
-    elif tag_name == 'div':
-        # Handle divs by processing their children
-        for child in element.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'table'], recursive=False):
-            process_element(doc, child)
+    if element.get_text().strip():  # Only add non-empty paragraphs
+        paragraph = doc.add_paragraph()
+        add_formatted_text(paragraph, element)
 
-def add_formatted_text(paragraph, element):
-    """Add formatted text to a paragraph"""
+def add_formatted_text(paragraph, element, contents=None):
+    """Add formatted text to a paragraph (from `contents` when given, else all of the element's children)"""
     
-    for content in element.contents:
+    for content in (element.contents if contents is None else contents):
         if hasattr(content, 'name') and content.name:
             # HTML element
             tag = content.name.lower()
@@ -122,7 +99,7 @@ def add_formatted_text(paragraph, element):
             elif tag == 'code':
                 run = paragraph.add_run(text)
                 run.font.name = 'Courier New'
-                run.font.size = Pt(10)
+                run.font.size = CODE_FONT_SIZE
             else:
                 paragraph.add_run(text)
         else:
@@ -131,14 +108,11 @@ def add_formatted_text(paragraph, element):
                 paragraph.add_run(str(content))
 
 def process_list(doc, list_element):
-    """Process HTML lists"""
-    
-    list_items = list_element.find_all('li', recursive=False)
-    list_style = 'List Number' if list_element.name == 'ol' else 'List Bullet'
+    """Process HTML lists (nested items follow their parent, one level deeper)"""
     
-    for item in list_items:
-        paragraph = doc.add_paragraph(style=list_style)
-        add_formatted_text(paragraph, item)
+    for item, level in iter_list_items(list_element):
+        paragraph = doc.add_paragraph(style=list_item_style(item, level))
+        add_formatted_text(paragraph, item, list_item_contents(item))
 
 def process_table(doc, table_element):
     """Process HTML tables"""
@@ -148,27 +122,37 @@ def process_table(doc, table_element):
         return
     
     # Count columns
-    max_cols = max(len(row.find_all(['td', 'th'])) for row in rows)
+    row_cells = [row.find_all(['td', 'th']) for row in rows]
+    max_cols = max(len(cells) for cells in row_cells)
+    if not max_cols:
+        return
     
     # Create table
     table = doc.add_table(rows=len(rows), cols=max_cols)
     table.style = 'Table Grid'
     
-    for row_idx, row in enumerate(rows):
-        cells = row.find_all(['td', 'th'])
+    for row_idx, cells in enumerate(row_cells):
         for col_idx, cell in enumerate(cells):
-            if col_idx < max_cols:
-                table_cell = table.cell(row_idx, col_idx)
-                # Clear default text
-                table_cell.text = ''
-                # Add content
-                paragraph = table_cell.paragraphs[0]
-                add_formatted_text(paragraph, cell)
-                
-                # Make headers bold
-                if cell.name == 'th':
-                    for run in paragraph.runs:
-                        run.bold = True
+            table_cell = table.cell(row_idx, col_idx)
+            # Clear default text
+            table_cell.text = ''
+            # Add content
+            paragraph = table_cell.paragraphs[0]
+            add_formatted_text(paragraph, cell)
+            
+            # Make headers bold
+            if cell.name == 'th':
+                for run in paragraph.runs:
+                    run.bold = True
+
+# Tag -> handler table used by the single-pass walker
+ELEMENT_HANDLERS = {
+    **{tag: process_heading for tag in HEADING_TAGS},
+    'p': process_paragraph,
+    'ul': process_list,
+    'ol': process_list,
+    'table': process_table,
+}
 
 def main():
     """Main function with examples"""
@@ -176,6 +160,13 @@ def main():
     print("🌟 HTML to DOCX Converter")
     print("=" * 50)
     
+    try:
+        load_docx_dependencies()
+        print("✅ All required packages imported successfully!")
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
     # Example 1: Simple HTML
     simple_html = """
     <html>
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Single-pass HTML walker shared by the HTML to DOCX converters
+
+Visits the elements under a root exactly once, in document order, and dispatches
+each one through a tag -> handler table. A handler owns its element's whole subtree
+(a <table> handler reads its own rows), so nothing is emitted twice; tags without a
+handler are treated as containers and their children are walked in place.
+"""
+
+import itertools
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+LIST_TAGS = ('ul', 'ol')
+
+# Never rendered as document content
+SKIP_TAGS = frozenset(['head', 'title', 'script', 'style', 'meta', 'link', 'noscript', 'template'])
+
+def load_docx_dependencies():
+    """
+    Import python-docx and BeautifulSoup on first use
+
+    Returns:
+        tuple: (Document, BeautifulSoup)
+
+    Raises:
+        ImportError: With the install command when a package is missing
+    """
+
+    try:
+        from docx import Document
+        from bs4 import BeautifulSoup
+    except ImportError as e:
+        raise ImportError(f"Missing package: {e.name}. "
+                          "Install with: pip install python-docx beautifulsoup4 lxml") from e
+    return Document, BeautifulSoup
+
+def content_root(soup):
+    """Return <body> if the document has one, otherwise the whole parse tree"""
+    return soup.body or soup
+
+def walk_elements(doc, root, handlers, skip_tags=SKIP_TAGS):
+    """
+    Dispatch every element under `root` to its handler, in document order
+
+    Args:
+        doc: Target document passed through to the handlers
+        root: BeautifulSoup element whose children are walked
+        handlers (dict): Tag name -> handler(doc, element)
+        skip_tags: Tag names whose subtrees are ignored
+
+    Returns:
+        int: Number of elements dispatched to a handler
+    """
+
+    dispatched = 0
+    # Explicit stack of child iterators, so deeply nested markup can't hit the recursion limit
+    stack = [iter(root.children)]
+    while stack:
+        for node in stack[-1]:
+            name = node.name
+            if name is None or name in skip_tags:
+                # Text, comments and non-content tags
+                continue
+            handler = handlers.get(name)
+            if handler is not None:
+                handler(doc, node)
+                dispatched += 1
+            else:
+                # Container (div, section, span, ...): descend, then resume with its siblings
+                stack.append(iter(node.children))
+                break
+        else:
+            stack.pop()
+    return dispatched
+
+def iter_list_items(list_element, level=1):
+    """
+    Yield (item, level) for every <li> of a list, in document order
+
+    A nested list's items follow the item that contains them, one level deeper, so each
+    item is yielded exactly once. Use list_item_contents() for an item's own content.
+
+    Args:
+        list_element: <ul> or <ol> element
+        level (int): Nesting level of `list_element`
+
+    Yields:
+        tuple: (<li> element, nesting level starting at `level`)
+    """
+
+    stack = [(iter(list_element.children), level)]
+    while stack:
+        children, depth = stack[-1]
+        for node in children:
+            if node.name == 'li':
+                yield node, depth
+                nested = [child for child in node.children if child.name in LIST_TAGS]
+                if nested:
+                    stack.append((itertools.chain.from_iterable(child.children for child in nested), depth + 1))
+                    break
+            elif node.name in LIST_TAGS:
+                # A list placed directly inside a list (without an <li>) is still one level deeper
+                stack.append((iter(node.children), depth + 1))
+                break
+        else:
+            stack.pop()
+
+def list_item_contents(item):
+    """Return the children of an <li> without its nested lists"""
+    return [child for child in item.contents if child.name not in LIST_TAGS]
+
+def list_item_style(item, level):
+    """Word list style for an <li>: 'List Bullet' / 'List Number', then ' 2' and ' 3' when nested"""
+    base = 'List Number' if item.parent.name == 'ol' else 'List Bullet'
+    return base if level == 1 else f"{base} {min(level, 3)}"
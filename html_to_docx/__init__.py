@@ -0,0 +1,51 @@
+"""
+HTML to DOCX Conversion
+
+Entry point for the HTML to DOCX converters in this repository. Importing the package
+has no side effects and loads nothing heavy; each converter (and python-docx,
+BeautifulSoup, lxml behind it) is imported the first time it is used:
+
+    import html_to_docx
+    html_to_docx.convert_html_to_docx(html_content, "report.docx")
+
+Command line:
+
+    python -m html_to_docx input.html -o output.docx [--engine converter|simple|complete]
+"""
+
+import importlib
+import os
+import sys
+
+# html_to_docx_converter lives with the call transcript sample
+_CALLTRANSCRIPT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "calltranscript")
+
+# Public name -> (module, attribute), resolved on first access
+_EXPORTS = {
+    "convert_html_to_docx": ("html_to_docx_simple", "convert_html_to_docx"),
+    "html_to_docx_converter": ("complete_html_to_docx_example", "html_to_docx_converter"),
+    "HTMLToDOCXConverter": ("html_to_docx_converter", "HTMLToDOCXConverter"),
+    "StreamingDocumentWriter": ("html_to_docx_converter", "StreamingDocumentWriter"),
+    "convert_html_string_to_docx": ("html_to_docx_converter", "convert_html_string_to_docx"),
+    "convert_html_file_to_docx": ("html_to_docx_converter", "convert_html_file_to_docx"),
+    "walk_elements": ("html_docx_walker", "walk_elements"),
+}
+
+__all__ = sorted(_EXPORTS)
+
+def _import(module_name):
+    if module_name == "html_to_docx_converter" and _CALLTRANSCRIPT_DIR not in sys.path:
+        sys.path.append(_CALLTRANSCRIPT_DIR)
+    return importlib.import_module(module_name)
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_import(module_name), attribute)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,66 @@
+"""
+Command line HTML to DOCX converter
+
+    python -m html_to_docx report.html                     # writes report.docx
+    python -m html_to_docx - -o report.docx < report.html  # HTML from stdin
+    python -m html_to_docx log.html --streaming --compresslevel 1
+"""
+
+import argparse
+import os
+import sys
+
+ENGINES = ("converter", "simple", "complete")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m html_to_docx", description="Convert HTML to a DOCX file.")
+    parser.add_argument("input", help="HTML file, or - for stdin")
+    parser.add_argument("-o", "--output", help="Output DOCX path (default: input name with .docx)")
+    parser.add_argument("--engine", choices=ENGINES, default="converter",
+                        help="converter: HTMLToDOCXConverter (default); simple / complete: the standalone scripts")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Stream the document body to disk (converter engine only)")
+    parser.add_argument("--compresslevel", type=int, default=6, choices=range(10), metavar="0-9",
+                        help="Deflate level when streaming (default: 6)")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.streaming and args.engine != "converter":
+        parser.error("--streaming requires --engine converter")
+
+    if args.input == "-":
+        html_content = sys.stdin.read()
+        output_path = args.output or "output.docx"
+    else:
+        try:
+            with open(args.input, "r", encoding="utf-8") as file:
+                html_content = file.read()
+        except OSError as e:
+            print(f"❌ Cannot read {args.input}: {e}", file=sys.stderr)
+            return 1
+        output_path = args.output or os.path.splitext(args.input)[0] + ".docx"
+
+    # Only the selected engine (and its dependencies) gets imported
+    import html_to_docx
+
+    try:
+        if args.engine == "converter":
+            converter = html_to_docx.HTMLToDOCXConverter(streaming=args.streaming, compresslevel=args.compresslevel)
+            converter.convert_html_to_docx(html_content, output_path)
+        elif args.engine == "simple":
+            html_to_docx.convert_html_to_docx(html_content, output_path)
+        else:
+            html_to_docx.html_to_docx_converter(html_content, output_path)
+    except ImportError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        if "pip install" not in str(e):
+            print("Install with: pip install python-docx beautifulsoup4 lxml", file=sys.stderr)
+        return 1
+
+    print(f"✅ {output_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
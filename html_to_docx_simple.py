@@ -9,20 +9,82 @@ import os
 import sys
 from datetime import datetime
 
-try:
-    from docx import Document
-    from docx.shared import Pt
-    from bs4 import BeautifulSoup
-    print("✅ Required packages loaded successfully!")
-except ImportError as e:
-    print(f"❌ Missing package: {e}")
-    print("Install with: pip install python-docx beautifulsoup4 lxml")
-    sys.exit(1)
+# python-docx and BeautifulSoup are imported on first conversion, keeping imports cheap
+from html_docx_walker import (HEADING_TAGS, content_root, iter_list_items, list_item_contents,
+                              list_item_style, load_docx_dependencies, walk_elements)
+
+def add_heading(doc, element):
+    """Add an <h1>-<h6> element as a heading of the same level"""
+    doc.add_heading(element.get_text().strip(), int(element.name[1]))
+
+def add_paragraph(doc, element):
+    """Add a <p> element with bold, italic and underline runs"""
+    text = element.get_text().strip()
+    if not text:
+        return
+    
+    paragraph = doc.add_paragraph()
+    
+    # Handle basic formatting
+    for child in element.children:
+        if hasattr(child, 'name') and child.name:
+            if child.name in ['strong', 'b']:
+                run = paragraph.add_run(child.get_text())
+                run.bold = True
+            elif child.name in ['em', 'i']:
+                run = paragraph.add_run(child.get_text())
+                run.italic = True
+            elif child.name == 'u':
+                run = paragraph.add_run(child.get_text())
+                run.underline = True
+            else:
+                paragraph.add_run(child.get_text())
+        else:
+            if str(child).strip():
+                paragraph.add_run(str(child))
+
+def add_list(doc, element):
+    """Add the items of a <ul> or <ol> element as list paragraphs, nested items one level deeper"""
+    for li, level in iter_list_items(element):
+        # The item's own text only; nested lists become their own paragraphs
+        text = ''.join(child.get_text() if child.name else str(child) for child in list_item_contents(li))
+        doc.add_paragraph(text.strip(), style=list_item_style(li, level))
+
+def add_table(doc, element):
+    """Add a <table> element as a grid table"""
+    rows = element.find_all('tr')
+    if not rows:
+        return
+    
+    # Count columns
+    row_cells = [row.find_all(['td', 'th']) for row in rows]
+    max_cols = max(len(cells) for cells in row_cells)
+    if not max_cols:
+        return
+    
+    # Create table
+    doc_table = doc.add_table(rows=len(rows), cols=max_cols)
+    doc_table.style = 'Table Grid'
+    
+    for row_idx, cells in enumerate(row_cells):
+        for col_idx, cell in enumerate(cells):
+            doc_table.cell(row_idx, col_idx).text = cell.get_text().strip()
+
+# Tag -> handler table used by the single-pass walker
+ELEMENT_HANDLERS = {
+    **{tag: add_heading for tag in HEADING_TAGS},
+    'p': add_paragraph,
+    'ul': add_list,
+    'ol': add_list,
+    'table': add_table,
+}
 
 def convert_html_to_docx(html_content, output_filename=None):
     """
     Convert HTML content to DOCX format
     
+    Elements are converted in one pass, in the order they appear in the HTML.
+    
     Args:
         html_content (str): HTML content as string
         output_filename (str): Optional output filename
@@ -31,6 +93,8 @@ def convert_html_to_docx(html_content, output_filename=None):
         str: Path to created DOCX file
     """
     
+    Document, BeautifulSoup = load_docx_dependencies()
+    
     # Create new document
     doc = Document()
     
@@ -43,61 +107,7 @@ def convert_html_to_docx(html_content, output_filename=None):
         doc.add_heading(title.string.strip(), 0)
     
     # Process content
-    body = soup.find('body') if soup.find('body') else soup
-    
-    # Handle different elements
-    for element in body.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-        level = int(element.name[1])
-        doc.add_heading(element.get_text().strip(), level)
-    
-    for element in body.find_all('p'):
-        text = element.get_text().strip()
-        if text:
-            paragraph = doc.add_paragraph()
-            
-            # Handle basic formatting
-            for child in element.children:
-                if hasattr(child, 'name') and child.name:
-                    if child.name in ['strong', 'b']:
-                        run = paragraph.add_run(child.get_text())
-                        run.bold = True
-                    elif child.name in ['em', 'i']:
-                        run = paragraph.add_run(child.get_text())
-                        run.italic = True
-                    elif child.name == 'u':
-                        run = paragraph.add_run(child.get_text())
-                        run.underline = True
-                    else:
-                        paragraph.add_run(child.get_text())
-                else:
-                    if str(child).strip():
-                        paragraph.add_run(str(child))
-    
-    # Handle lists
-    for ul in body.find_all('ul'):
-        for li in ul.find_all('li'):
-            doc.add_paragraph(li.get_text().strip(), style='List Bullet')
-    
-    for ol in body.find_all('ol'):
-        for li in ol.find_all('li'):
-            doc.add_paragraph(li.get_text().strip(), style='List Number')
-    
-    # Handle tables
-    for table in body.find_all('table'):
-        rows = table.find_all('tr')
-        if rows:
-            # Count columns
-            max_cols = max(len(row.find_all(['td', 'th'])) for row in rows)
-            
-            # Create table
-            doc_table = doc.add_table(rows=len(rows), cols=max_cols)
-            doc_table.style = 'Table Grid'
-            
-            for row_idx, row in enumerate(rows):
-                cells = row.find_all(['td', 'th'])
-                for col_idx, cell in enumerate(cells):
-                    if col_idx < max_cols:
-                        doc_table.cell(row_idx, col_idx).text = cell.get_text().strip()
+    walk_elements(doc, content_root(soup), ELEMENT_HANDLERS)
     
     # Generate filename if not provided
     if not output_filename:
@@ -114,6 +124,13 @@ def main():
     print("🌟 HTML to DOCX Converter Demo")
     print("=" * 40)
     
+    try:
+        load_docx_dependencies()
+        print("✅ Required packages loaded successfully!")
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
     # Sample HTML content
     sample_html = """
     <html>
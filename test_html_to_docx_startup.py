@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+HTML to DOCX Startup Benchmark
+
+Imports each converter module in a fresh `python -X importtime` process and checks
+that startup stays cheap: nothing printed, and no python-docx / BeautifulSoup / lxml
+until a conversion runs. The checks look at which modules were imported, not at timings;
+run directly for a report of cumulative import times, or collect the test_* functions
+with pytest.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+CALLTRANSCRIPT_DIR = os.path.join(REPO_DIR, "calltranscript")
+
+MODULES = [
+    "html_to_docx",
+    "html_to_docx.__main__",
+    "html_docx_walker",
+    "html_to_docx_simple",
+    "complete_html_to_docx_example",
+    "html_to_docx_converter",
+]
+
+# Loaded only when a conversion runs
+HEAVY_PACKAGES = {"docx", "bs4", "lxml"}
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_DIR, CALLTRANSCRIPT_DIR, env.get("PYTHONPATH")]))
+    return env
+
+def measure_import(statement):
+    """
+    Run `statement` under -X importtime in a fresh interpreter
+
+    Returns:
+        dict: stdout, and imported module -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_DIR, env=_env(), capture_output=True, text=True, check=True
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total)
+    return {"stdout": result.stdout, "modules": cumulative}
+
+def test_no_output_at_import():
+    for module in MODULES:
+        assert measure_import(f"import {module}")["stdout"] == "", f"{module} prints at import time"
+
+def test_no_heavy_dependencies_at_import():
+    for module in MODULES:
+        imported = measure_import(f"import {module}")["modules"]
+        heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY_PACKAGES)
+        assert not heavy, f"{module} imports {heavy[:3]} at import time"
+
+def test_dependencies_load_on_first_use():
+    pytest.importorskip("docx")
+    pytest.importorskip("bs4")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "startup.docx")
+        statement = (
+            "import sys, html_to_docx; "
+            "assert 'docx' not in sys.modules; "
+            f"html_to_docx.convert_html_string_to_docx('<h1>Status</h1><p>Ready</p>', {output!r}, streaming=True); "
+            "assert 'docx' in sys.modules"
+        )
+        measure_import(statement)
+        assert os.path.getsize(output) > 0
+
+def report():
+    """Print cumulative import times next to the cost of the eager dependencies"""
+
+    print("⏱️  HTML to DOCX Startup Benchmark (python -X importtime)")
+    print("=" * 60)
+    for module in MODULES:
+        imported = measure_import(f"import {module}")["modules"]
+        print(f"   {module:<32} {imported[module] / 1000:>7.1f} ms")
+
+    try:
+        eager = measure_import("import docx, bs4")["modules"]
+        eager_ms = (eager["docx"] + eager["bs4"]) / 1000
+        print(f"   {'(eager: import docx, bs4)':<32} {eager_ms:>7.1f} ms  deferred to first conversion")
+    except subprocess.CalledProcessError:
+        print("   python-docx / beautifulsoup4 not installed - eager cost not measured")
+
+if __name__ == "__main__":
+    report()
+
+    failures = 0
+    for name, test in [(name, value) for name, value in globals().items() if name.startswith("test_")]:
+        try:
+            test()
+            print(f"✅ {name}")
+        except pytest.skip.Exception as e:
+            print(f"⏭️  {name}: {e}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failures else 0)